@@ -0,0 +1,49 @@
+"""
+Django settings used when running the test suite.
+
+Extends the default settings with overrides that make tests faster.
+"""
+
+import os
+import tempfile
+
+from app.settings import *  # noqa: F401,F403
+
+
+# Password hashing
+# A fast, insecure hasher so creating test users does not dominate runtime
+# https://docs.djangoproject.com/en/3.2/topics/testing/overview/#password-hashing
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Database
+# An in-memory SQLite database keeps test writes off the disk
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+
+class DisableMigrations:
+    """Build the test schema directly from the models, skipping migrations"""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+
+# Media files
+# Uploads made by tests go to the system temp directory, not the media volume
+
+MEDIA_ROOT = os.path.join(tempfile.gettempdir(), 'recipe-app-api', 'media')
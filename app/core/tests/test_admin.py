@@ -5,19 +5,22 @@ from django.urls import reverse
 
 class AdminSiteTests(TestCase):
 
-    def setUp(self):
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = get_user_model().objects.create_superuser(
             email='admin@random.com',
             password='Password1'
         )
-        self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             email='random@random.com',
             password='Password1',
             name='Test User full name'
         )
 
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
     def test_users_listed(self):
         """Test that users are listed on user page"""
 
@@ -28,8 +31,10 @@ class AdminSiteTests(TestCase):
         res = self.client.get(url)
 
         # Then
-        self.assertContains(res, self.user.name)
-        self.assertContains(res, self.user.email)
+        self.assertEqual(res.status_code, 200)
+        body = res.content.decode(res.charset)
+        self.assertIn(self.user.name, body)
+        self.assertIn(self.user.email, body)
 
     def test_user_edit_page(self):
         """Test that the user edit page works"""
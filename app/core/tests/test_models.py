@@ -12,6 +12,10 @@ def sample_user(email='random@random.com', password='Password1'):
 
 class ModelTests(TestCase):
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.shared_user = sample_user(email='shared@random.com')
+
     # -------------------------------
     # model: USER
     # -------------------------------
@@ -78,7 +82,7 @@ class ModelTests(TestCase):
     def test_tag_str(self):
         """Test the tag string representation"""
         tag = models.Tag.objects.create(
-            user=sample_user(),
+            user=self.shared_user,
             name='Dessert'
         )
 
@@ -91,7 +95,7 @@ class ModelTests(TestCase):
     def test_ingredient_str(self):
         """Test the ingredient string representation"""
         ingredient = models.Ingredient.objects.create(
-            user=sample_user(),
+            user=self.shared_user,
             name='Sugar'
         )
 
@@ -104,7 +108,7 @@ class ModelTests(TestCase):
     def test_recipe_str(self):
         """Test the recipe string representation"""
         recipe = models.Recipe.objects.create(
-            user=sample_user(),
+            user=self.shared_user,
             title='Fruit Cake',
             time_minutes=60,
             price=10.00
@@ -112,7 +116,7 @@ class ModelTests(TestCase):
 
         self.assertEqual(str(recipe), recipe.title)
 
-    @patch('uuid.uuid4')
+    @patch('core.models.uuid.uuid4')
     def test_recipe_filename_uuid(self, mock_uuid):
         """Test that image is saved in the correct location"""
 
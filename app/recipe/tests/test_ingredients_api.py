@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -13,11 +13,9 @@ from recipe.serializers import IngredientSerializer
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
 
-class PublicIngredientsApiTests(TestCase):
+class PublicIngredientsApiTests(SimpleTestCase):
     """Test publicly available ingredients API"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         """Test that authentication is required to retrieve ingredients"""
@@ -27,21 +25,26 @@ class PublicIngredientsApiTests(TestCase):
 
 class PrivateIngredientsApiTests(TestCase):
     """Test private ingredients API"""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'random@random.com',
             'MOCK_PASSWORD'
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredient_list(self):
         """Test retrieve list of ingredients"""
 
         # Given existing ingredients
-        Ingredient.objects.create(user=self.user, name='Pomegranite')
-        Ingredient.objects.create(user=self.user, name='Aubergine')
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Pomegranite'),
+            Ingredient(user=self.user, name='Aubergine'),
+        ])
 
         # When
         response = self.client.get(INGREDIENTS_URL)
@@ -50,9 +53,10 @@ class PrivateIngredientsApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Then the response contains the ingredients
-        expected_ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(expected_ingredients, many=True)
-        expected_data = serializer.data
+        expected_data = [
+            {'id': ingredient.id, 'name': ingredient.name}
+            for ingredient in Ingredient.objects.order_by('-name')
+        ]
         self.assertEqual(response.data, expected_data)
 
     def test_retrieve_ingredients_list_for_user(self):
@@ -85,12 +89,14 @@ class PrivateIngredientsApiTests(TestCase):
         payload = {'name': 'Broccoli'}
 
         # When
-        self.client.post(INGREDIENTS_URL, payload)
+        response = self.client.post(INGREDIENTS_URL, payload)
 
         # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['name'], payload['name'])
         exists = Ingredient.objects.filter(
             user=self.user,
-            name=payload['name'],
+            id=response.data['id']
         ).exists()
         self.assertTrue(exists)
 
@@ -141,14 +147,13 @@ class PrivateIngredientsApiTests(TestCase):
             price=4.00,
             user=self.user
         )
-        recipe1.ingredients.add(ingredient)
         recipe2 = Recipe.objects.create(
             title='Spaghetti Bolognese',
             time_minutes=60,
             price=4.00,
             user=self.user
         )
-        recipe2.ingredients.add(ingredient)
+        ingredient.recipe_set.add(recipe1, recipe2)
 
         # When
         response = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
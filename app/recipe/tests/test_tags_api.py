@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -13,11 +13,9 @@ from recipe.serializers import TagSerializer
 TAGS_URL = reverse('recipe:tag-list')
 
 
-class PublicTagsApiTests(TestCase):
+class PublicTagsApiTests(SimpleTestCase):
     """Test the publicly available Tags API"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test that authentication is required for retrieving tags"""
@@ -28,21 +26,26 @@ class PublicTagsApiTests(TestCase):
 
 class PrivateTagsApiTests(TestCase):
     """Test the authorised user Tags API"""
+    client_class = APIClient
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'random@random.com',
             'Password1'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
         """Test retrieve tags"""
 
         # Given
-        Tag.objects.create(user=self.user, name='Dessert')
-        Tag.objects.create(user=self.user, name='Starter')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Dessert'),
+            Tag(user=self.user, name='Starter'),
+        ])
 
         # When
         response = self.client.get(TAGS_URL)
@@ -51,9 +54,10 @@ class PrivateTagsApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Then the tags are returned
-        expected_tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(expected_tags, many=True)
-        expected_data = serializer.data
+        expected_data = [
+            {'id': tag.id, 'name': tag.name}
+            for tag in Tag.objects.order_by('-name')
+        ]
         self.assertEqual(response.data, expected_data)
 
     def test_retrieve_tags_only_for_user(self):
@@ -86,12 +90,14 @@ class PrivateTagsApiTests(TestCase):
         payload = {'name': 'TAG_NAME'}
 
         # When
-        self.client.post(TAGS_URL, payload)
+        response = self.client.post(TAGS_URL, payload)
 
         # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['name'], payload['name'])
         exists = Tag.objects.filter(
             user=self.user,
-            name=payload['name']
+            id=response.data['id']
         ).exists()
         self.assertTrue(exists)
 
@@ -142,14 +148,13 @@ class PrivateTagsApiTests(TestCase):
             price=2.50,
             user=self.user
         )
-        recipe1.tags.add(tag)
         recipe2 = Recipe.objects.create(
             title='Porridge',
             time_minutes=5,
             price=1.50,
             user=self.user
         )
-        recipe2.tags.add(tag)
+        tag.recipe_set.add(recipe1, recipe2)
 
         # When
         response = self.client.get(TAGS_URL, {'assigned_only': 1})
@@ -1,48 +1,66 @@
-from django.test import TestCase
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 from rest_framework.test import APIClient
-from rest_framework import status
 
 
 CREATE_USER_URL = reverse('user:create')
 TOKEN_URL = reverse('user:token')
 ME_URL = reverse('user:me')
 
+User = get_user_model()
+
+VALID_PAYLOAD = {
+    'email': 'random@random.com',
+    'password': 'MOCK_PASSWORD',
+    'name': 'MOCK_NAME'
+}
+SHORT_PASSWORD_PAYLOAD = {**VALID_PAYLOAD, 'password': '1234'}
+
 
 def create_user(**params):
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
+
+
+class JsonPostMixin:
+    """Post request payloads to the user API encoded as JSON"""
 
+    def _post(self, url, payload):
+        return self.client.post(url, payload, format='json')
 
-class PublicUserApiTests(TestCase):
+
+class PublicUserApiTests(JsonPostMixin, TestCase):
     """Test the users API (public)"""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
+            email='existing@random.com',
+            password='MOCK_PASSWORD'
+        )
 
     # ------------------------------------------------------
     # CREATE USER tests
     # ------------------------------------------------------
 
-    def setUp(self):
-        self.client = APIClient()
-
     def test_create_user_success(self):
         """Test that create user with valid payload is successful"""
 
         # Given
-        payload = {
-            'email': 'random@random.com',
-            'password': 'MOCK_PASSWORD',
-            'name': 'MOCK_NAME'
-        }
+        payload = VALID_PAYLOAD
 
         # When
-        response = self.client.post(CREATE_USER_URL, payload)
+        response = self._post(CREATE_USER_URL, payload)
 
         # Then a success response status is returned
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.status_code, 201)
 
         # Then the password is stored for the user
-        user = get_user_model().objects.get(**response.data)
+        user = User.objects.get(email=response.data['email'])
         self.assertTrue(user.check_password(payload['password']))
 
         # Then the password is not returned in the response
@@ -52,40 +70,30 @@ class PublicUserApiTests(TestCase):
         """Test creating a user that already exists fails"""
 
         # Given a user that already exists
-        payload = {
-            'email': 'random@random.com',
-            'password': 'MOCK_PASSWORD',
-            'name': 'MOCK_NAME'
-        }
+        payload = VALID_PAYLOAD
         create_user(**payload)
 
         # When
-        response = self.client.post(CREATE_USER_URL, payload)
+        response = self._post(CREATE_USER_URL, payload)
 
         # Then a bad request status is returned
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.status_code, 400)
 
     def test_create_user_with_password_too_short(self):
         """Test creating a user with a password
          that is not more than 5 characters"""
 
         # Given a create user request with a too-short password
-        payload = {
-            'email': 'random@random.com',
-            'password': '1234',
-            'name': 'MOCK_NAME'
-        }
+        payload = SHORT_PASSWORD_PAYLOAD
 
         # When
-        response = self.client.post(CREATE_USER_URL, payload)
+        response = self._post(CREATE_USER_URL, payload)
 
         # Then a bad request status is returned
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.status_code, 400)
 
         # Then the user is not created
-        user_exists = get_user_model().objects.filter(
-            email=payload['email']
-        ).exists()
+        user_exists = User.objects.filter(email=payload['email']).exists()
         self.assertFalse(user_exists)
 
     # ------------------------------------------------------
@@ -96,71 +104,57 @@ class PublicUserApiTests(TestCase):
         """Test that a token is created for the user"""
 
         # Given
-        payload = {'email': 'random@random.com', 'password': 'MOCK_PASSWORD'}
-        create_user(**payload)
+        payload = {'email': self.user.email, 'password': 'MOCK_PASSWORD'}
 
         # When
-        response = self.client.post(TOKEN_URL, payload)
+        response = self._post(TOKEN_URL, payload)
 
         # Then the response is successful
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, 200)
 
         # Then the response contains a token
         self.assertIn('token', response.data)
 
-    def test_create_token_invalid_credentials(self):
-        """Test that token is not created for invalid credentials"""
+    def test_create_token_rejected(self):
+        """Test that token is not created for invalid credentials,
+         a non-existent user or a missing password"""
 
         # Given
-        create_user(email='random@random.com', password='MOCK_PASSWORD')
-        payload = {
-            'email': 'random@random.com',
-            'password': 'MOCK_INVALID_PASSWORD'
+        cases = {
+            'invalid credentials': {
+                'email': self.user.email,
+                'password': 'MOCK_INVALID_PASSWORD'
+            },
+            'no user': {
+                'email': 'random@random.com',
+                'password': 'MOCK_PASSWORD'
+            },
+            'missing password': {'email': self.user.email, 'password': ''},
         }
 
-        # When
-        response = self.client.post(TOKEN_URL, payload)
-
-        # Then the response fails
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-        # Then the response does not contain a token
-        self.assertNotIn('token', response.data)
-
-    def test_create_token_no_user(self):
-        """Test that token is not created for non-existent user"""
-
-        # Given
-        payload = {'email': 'random@random.com', 'password': 'MOCK_PASSWORD'}
-
-        # When
-        response = self.client.post(TOKEN_URL, payload)
-
-        # Then the response fails
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for case, payload in cases.items():
+            with self.subTest(case):
+                # When
+                response = self._post(TOKEN_URL, payload)
 
-        # Then the response does not contain a token
-        self.assertNotIn('token', response.data)
+                # Then the response fails
+                self.assertEqual(response.status_code, 400)
 
-    def test_create_token_missing_password(self):
-        """Test that email and password are required"""
-
-        # Given
-        create_user(email='random@random.com', password='MOCK_PASSWORD')
-        payload = {'email': 'random@random.com', 'password': ''}
-
-        # When
-        response = self.client.post(TOKEN_URL, payload)
+                # Then the response does not contain a token
+                self.assertNotIn('token', response.data)
 
-        # Then the response fails
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-        # Then the response does not contain a token
-        self.assertNotIn('token', response.data)
+class MeEndpointAuthTests(JsonPostMixin, SimpleTestCase):
+    """Test ME API requests that do not need a stored user"""
+    client_class = APIClient
 
-    # ------------------------------------------------------
-    # ME tests
-    # ------------------------------------------------------
+    def setUp(self):
+        self.fake_user = SimpleNamespace(
+            name='MOCK_NAME',
+            email='random@random.com',
+            is_authenticated=True,
+            pk=1
+        )
 
     def test_get_me_unauthorised(self):
         """Test that authentication is required for users"""
@@ -171,43 +165,50 @@ class PublicUserApiTests(TestCase):
         response = self.client.get(ME_URL)
 
         # Then
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
-
-class PrivateUserApiTests(TestCase):
-    """Test API requests that require authentication"""
-
-    def setUp(self):
-        self.user = create_user(
-            email='random@random.com',
-            password='MOCK_PASSWORD',
-            name='MOCK_NAME'
-        )
-        self.client = APIClient()
-        self.client.force_authenticate(user=self.user)
+        self.assertEqual(response.status_code, 401)
 
     def test_get_me_success(self):
         """Test get me for authenticated user"""
+        self.client.force_authenticate(user=self.fake_user)
+
         response = self.client.get(ME_URL)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, 200)
         self.assertEqual(
             response.data,
             {
-                'name': self.user.name,
-                'email': self.user.email
+                'name': self.fake_user.name,
+                'email': self.fake_user.email
             },
         )
 
     def test_post_me_not_allowed(self):
         """Test that POST is not allowed on me URL"""
 
-        # Given / When
-        response = self.client.post(ME_URL, {})
+        # Given an authenticated user
+        self.client.force_authenticate(user=self.fake_user)
+
+        # When
+        response = self._post(ME_URL, {})
 
         # Then
-        self.assertEqual(
-            response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        self.assertEqual(response.status_code, 405)
+
+
+class PrivateUserApiTests(TestCase):
+    """Test API requests that require authentication"""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
+            email='random@random.com',
+            password='MOCK_PASSWORD',
+            name='MOCK_NAME'
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
 
     def test_update_me_success(self):
         """Test updating the user profile for authenticated user"""
@@ -219,12 +220,12 @@ class PrivateUserApiTests(TestCase):
         }
 
         # When
-        response = self.client.patch(ME_URL, payload)
+        response = self.client.patch(ME_URL, payload, format='json')
 
         # Then request is successful
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, 200)
 
         # Then user is updated
-        self.user.refresh_from_db()
-        self.assertEqual(self.user.name, payload['name'])
-        self.assertTrue(self.user.check_password(payload['password']))
+        self.assertEqual(response.data['name'], payload['name'])
+        user = User.objects.only('password').get(pk=self.user.pk)
+        self.assertTrue(user.check_password(payload['password']))